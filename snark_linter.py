@@ -7,6 +7,11 @@ Step 6: JSON Output Mode
 - We add a '--json' flag. If present, we output the comedic issues as a JSON array.
 - Otherwise, we continue the usual plain-text output.
 
+Step 7: Batch Mode
+- Several files and/or directories can be linted in one run.
+- '--jobs N' spreads the files over N worker processes.
+- JSON output stays one array; each item also names its "file".
+
 Existing checks:
 - Syntax errors (single comedic message if parse fails)
 - AST-based:
@@ -21,278 +26,488 @@ Existing checks:
 """
 
 import ast
+import heapq
+import io
+import itertools
 import sys
 import os
 import re
 import json
+import mmap
 import tokenize
 
 CAPWORDS_REGEX = re.compile(r'^[A-Z][a-zA-Z0-9]+(?:[A-Z0-9][a-zA-Z0-9]*)*$')
 SNAKE_CASE_REGEX = re.compile(r'^[a-z_][a-z0-9_]*$')
+SENTENCE_END_CHARS = frozenset('.!?')
+MMAP_THRESHOLD = 256 * 1024  # Bytes; bigger files are decoded straight from a mapping
+
+# Issues are stored as (line, message_id, args) and only %-formatted when
+# they are actually printed, so unused messages cost nothing to build.
+# Issues are sorted as plain tuples, so ties on a line are broken by
+# message ID and then by args, not by the order the checks ran in.
+(
+    MSG_SYNTAX_ERROR,
+    MSG_CLASS_NOT_CAPWORDS,
+    MSG_CLASS_NO_DOCSTRING,
+    MSG_FUNCTION_FOUND,
+    MSG_FUNCTION_NOT_SNAKE_CASE,
+    MSG_FUNCTION_NO_DOCSTRING,
+    MSG_DOCSTRING_TOO_SHORT,
+    MSG_DOCSTRING_NO_CAPITAL,
+    MSG_DOCSTRING_NO_PUNCTUATION,
+    MSG_SINGLE_LETTER_VARIABLE,
+    MSG_NESTED_FOR,
+    MSG_NESTED_WHILE,
+    MSG_COMMENT_TOO_LONG,
+    MSG_COMMENT,
+    MSG_COMMENT_LINE_TOO_LONG,
+    MSG_LINE_TOO_LONG,
+    MSG_MULTIPLE_IMPORTS,
+    MSG_MULTIPLE_FROM_IMPORTS,
+) = range(18)
+
+MESSAGES = {
+    MSG_SYNTAX_ERROR: (
+        "Wow, syntax error at line %d. "
+        "Did you even try to run this code yourself? I can't parse this nonsense."
+    ),
+    MSG_CLASS_NOT_CAPWORDS: (
+        "Class '%s' at line %d is not in CapWords style. "
+        "Do you even PEP 8, bro?"
+    ),
+    MSG_CLASS_NO_DOCSTRING: (
+        "Class '%s' at line %d has no docstring. "
+        "Why bother writing code if no one knows what it does?"
+    ),
+    MSG_FUNCTION_FOUND: (
+        "Found a function named '%s' at line %d. "
+        "Is this your attempt at structured programming? How quaint."
+    ),
+    MSG_FUNCTION_NOT_SNAKE_CASE: (
+        "Function '%s' at line %d is not snake_case. "
+        "We only speak underscores around here."
+    ),
+    MSG_FUNCTION_NO_DOCSTRING: (
+        "Function '%s' at line %d has no docstring. "
+        "Don't keep secrets from your future self!"
+    ),
+    MSG_DOCSTRING_TOO_SHORT: (
+        "%s '%s' at line %d has a docstring with only "
+        "%d characters. That's barely a grunt, not a docstring."
+    ),
+    MSG_DOCSTRING_NO_CAPITAL: (
+        "%s '%s' at line %d has a docstring that doesn't start with a capital letter. "
+        "Where's your sense of grammar?"
+    ),
+    MSG_DOCSTRING_NO_PUNCTUATION: (
+        "%s '%s' at line %d has a docstring that doesn't end with punctuation. "
+        "Finish your sentence, please."
+    ),
+    MSG_SINGLE_LETTER_VARIABLE: (
+        "Single-letter variable '%s' at line %d. "
+        "Oh sure, I'd never guess what it means, but I'm sure it's clear to YOU."
+    ),
+    MSG_NESTED_FOR: (
+        "Nested loop at line %d. "
+        "You do realize we invented break and return statements, right?"
+    ),
+    MSG_NESTED_WHILE: (
+        "Nested loop at line %d. "
+        "Yikes, a while loop inside another loop? Are you allergic to simplicity?"
+    ),
+    MSG_COMMENT_TOO_LONG: (
+        "This comment at line %d is %d characters long. "
+        "Way to kill the readability. 72 was too short for you?"
+    ),
+    MSG_COMMENT: (
+        "Extraneous comment at line %d. "
+        "Real developers keep it all in their heads: %s"
+    ),
+    MSG_COMMENT_LINE_TOO_LONG: (
+        "Line %d has %d characters in a comment. "
+        "72 is the limit, but apparently your brilliance needed more space?"
+    ),
+    MSG_LINE_TOO_LONG: (
+        "Line %d has %d characters. "
+        "Trying to write the next War and Peace in one line?"
+    ),
+    MSG_MULTIPLE_IMPORTS: (
+        "Multiple imports on one line at %d. "
+        "You think we can read two modules in one breath?"
+    ),
+    MSG_MULTIPLE_FROM_IMPORTS: (
+        "Multiple imports on one line at %d. "
+        "One import statement per line, please. Our tiny eyes can't parse multiple."
+    ),
+}
+
+
+def _is_capwords(name):
+    """
+    Plain string-method equivalent of CAPWORDS_REGEX: an ASCII capital
+    followed by at least one more ASCII letter or digit.
+    """
+    return len(name) > 1 and name.isascii() and name.isalnum() and name[0].isupper()
+
 
+def _is_snake_case(name):
+    """
+    Plain string-method equivalent of SNAKE_CASE_REGEX: ASCII lowercase
+    letters, digits and underscores, not starting with a digit.
+    """
+    if not name or not name.isascii() or name[0].isdigit():
+        return False
+    # Underscores become a lowercase letter so isalnum/islower can judge the rest
+    name = name.replace('_', 'x')
+    return name.isalnum() and name.islower()
 
-class SnarkLinter(ast.NodeVisitor):
+
+def format_message(message_id, args):
+    """
+    Render a stored (message_id, args) pair into its comedic text.
     """
-    A custom AST visitor that complains about normal code constructs,
+    return MESSAGES[message_id] % args
+
+
+class SnarkLinter:
+    """
+    A custom AST walker that complains about normal code constructs,
     plus naming conventions for classes and functions,
     plus docstring checks.
     """
 
-    def __init__(self, file_path):
-        super().__init__()
+    def __init__(self, file_path, strict=False):
         self.file_path = file_path
         self.issues = []
-        self.loop_depth = 0  # Track loop depth for nested loops
-
-    def visit_ClassDef(self, node):
+        # Bound once so the per-node handlers skip the global/attribute lookups.
+        # Strict mode falls back to the reference regexes for naming checks.
+        if strict:
+            self._cap_match = CAPWORDS_REGEX.match
+            self._snake_match = SNAKE_CASE_REGEX.match
+        else:
+            self._cap_match = _is_capwords
+            self._snake_match = _is_snake_case
+        self._issues_append = self.issues.append
+        # Only node types we actually complain about get a handler.
+        # Loop handlers fire only for loops that sit inside another loop.
+        self._dispatch = {
+            ast.ClassDef: self._on_class,
+            ast.FunctionDef: self._on_func,
+            ast.Assign: self._on_assign,
+        }
+        self._loop_dispatch = {
+            ast.For: self._on_nested_for,
+            ast.While: self._on_nested_while,
+        }
+
+    def analyze(self, tree):
+        """
+        Walk the whole tree once, dispatching on node type.
+        Each pending node carries whether it sits inside a loop, so nested
+        loops are found in the same flat pass, without parent links or
+        a recursive visit.
+        """
+        dispatch_get = self._dispatch.get
+        loop_dispatch_get = self._loop_dispatch.get
+        iter_child_nodes = ast.iter_child_nodes
+        pending = [(tree, False)]
+        pop = pending.pop
+        extend = pending.extend
+        while pending:
+            node, in_loop = pop()
+            node_type = type(node)
+            handler = dispatch_get(node_type)
+            if handler is not None:
+                handler(node)
+            loop_handler = loop_dispatch_get(node_type)
+            if loop_handler is not None:
+                if in_loop:
+                    loop_handler(node)
+                in_loop = True
+            extend((child, in_loop) for child in iter_child_nodes(node))
+
+    def _on_class(self, node):
         # Class naming
-        if not CAPWORDS_REGEX.match(node.name):
-            message = (
-                f"Class '{node.name}' at line {node.lineno} is not in CapWords style. "
-                "Do you even PEP 8, bro?"
+        if not self._cap_match(node.name):
+            self._issues_append(
+                (node.lineno, MSG_CLASS_NOT_CAPWORDS, (node.name, node.lineno))
             )
-            self.issues.append((node.lineno, message))
 
         # Docstring
         docstring = ast.get_docstring(node)
         if not docstring:
-            msg = (
-                f"Class '{node.name}' at line {node.lineno} has no docstring. "
-                "Why bother writing code if no one knows what it does?"
+            self._issues_append(
+                (node.lineno, MSG_CLASS_NO_DOCSTRING, (node.name, node.lineno))
             )
-            self.issues.append((node.lineno, msg))
         else:
-            self._check_docstring_rules(docstring, node.lineno, f"Class '{node.name}'")
-
-        self.generic_visit(node)
+            self._check_docstring_rules(docstring, node.lineno, "Class", node.name)
 
-    def visit_FunctionDef(self, node):
+    def _on_func(self, node):
         # Snark about functions existing at all
-        basic_message = (
-            f"Found a function named '{node.name}' at line {node.lineno}. "
-            "Is this your attempt at structured programming? How quaint."
+        self._issues_append(
+            (node.lineno, MSG_FUNCTION_FOUND, (node.name, node.lineno))
         )
-        self.issues.append((node.lineno, basic_message))
 
         # Function name snake_case
-        if not SNAKE_CASE_REGEX.match(node.name):
-            name_msg = (
-                f"Function '{node.name}' at line {node.lineno} is not snake_case. "
-                "We only speak underscores around here."
+        if not self._snake_match(node.name):
+            self._issues_append(
+                (node.lineno, MSG_FUNCTION_NOT_SNAKE_CASE, (node.name, node.lineno))
             )
-            self.issues.append((node.lineno, name_msg))
 
         # Docstring
         docstring = ast.get_docstring(node)
         if not docstring:
-            msg = (
-                f"Function '{node.name}' at line {node.lineno} has no docstring. "
-                "Don't keep secrets from your future self!"
+            self._issues_append(
+                (node.lineno, MSG_FUNCTION_NO_DOCSTRING, (node.name, node.lineno))
             )
-            self.issues.append((node.lineno, msg))
         else:
-            self._check_docstring_rules(docstring, node.lineno, f"Function '{node.name}'")
-
-        self.generic_visit(node)
+            self._check_docstring_rules(docstring, node.lineno, "Function", node.name)
 
-    def _check_docstring_rules(self, docstring, lineno, entity_name):
+    def _check_docstring_rules(self, docstring, lineno, kind, name):
         # Check length
-        if len(docstring) < 10:
-            short_msg = (
-                f"{entity_name} at line {lineno} has a docstring with only "
-                f"{len(docstring)} characters. That's barely a grunt, not a docstring."
+        length = len(docstring)
+        if length < 10:
+            self._issues_append(
+                (lineno, MSG_DOCSTRING_TOO_SHORT, (kind, name, lineno, length))
             )
-            self.issues.append((lineno, short_msg))
 
         # Capital letter at start
-        first_char = docstring[0]
-        if not first_char.isupper():
-            cap_msg = (
-                f"{entity_name} at line {lineno} has a docstring that doesn't start with a capital letter. "
-                "Where's your sense of grammar?"
+        if not docstring[0].isupper():
+            self._issues_append(
+                (lineno, MSG_DOCSTRING_NO_CAPITAL, (kind, name, lineno))
             )
-            self.issues.append((lineno, cap_msg))
 
         # End with punctuation
-        last_char = docstring[-1]
-        if last_char not in ('.', '!', '?'):
-            end_msg = (
-                f"{entity_name} at line {lineno} has a docstring that doesn't end with punctuation. "
-                "Finish your sentence, please."
+        if docstring[-1] not in SENTENCE_END_CHARS:
+            self._issues_append(
+                (lineno, MSG_DOCSTRING_NO_PUNCTUATION, (kind, name, lineno))
             )
-            self.issues.append((lineno, end_msg))
 
-    def visit_Assign(self, node):
+    def _on_assign(self, node):
         # Single-letter variable check
         for target in node.targets:
             if isinstance(target, ast.Name):
                 var_name = target.id
                 if len(var_name) == 1 and var_name.isalpha():
-                    message = (
-                        f"Single-letter variable '{var_name}' at line {node.lineno}. "
-                        "Oh sure, I'd never guess what it means, but I'm sure it's clear to YOU."
+                    self._issues_append(
+                        (node.lineno, MSG_SINGLE_LETTER_VARIABLE, (var_name, node.lineno))
                     )
-                    self.issues.append((node.lineno, message))
-        self.generic_visit(node)
 
-    def visit_For(self, node):
+    def _on_nested_for(self, node):
         # Nested loops
-        self.loop_depth += 1
-        if self.loop_depth > 1:
-            message = (
-                f"Nested loop at line {node.lineno}. "
-                "You do realize we invented break and return statements, right?"
-            )
-            self.issues.append((node.lineno, message))
-
-        self.generic_visit(node)
-        self.loop_depth -= 1
+        self._issues_append((node.lineno, MSG_NESTED_FOR, (node.lineno,)))
 
-    def visit_While(self, node):
+    def _on_nested_while(self, node):
         # Nested loops
-        self.loop_depth += 1
-        if self.loop_depth > 1:
-            message = (
-                f"Nested loop at line {node.lineno}. "
-                "Yikes, a while loop inside another loop? Are you allergic to simplicity?"
-            )
-            self.issues.append((node.lineno, message))
-
-        self.generic_visit(node)
-        self.loop_depth -= 1
+        self._issues_append((node.lineno, MSG_NESTED_WHILE, (node.lineno,)))
 
 
-def find_comment_issues(file_path):
+def find_comment_issues(source_code):
     """
     Token-based check for comments. We mock the presence of comments
     and also mock if they're too long (>72 chars).
+    Tokenizes the already-decoded source, so no encoding detection is needed.
     """
     issues = []
-    if not os.path.exists(file_path):
-        return issues
-
-    with open(file_path, 'rb') as f:
-        tokens = tokenize.tokenize(f.readline)
-        for token in tokens:
-            if token.type == tokenize.COMMENT:
-                line_num = token.start[0]
-                comment_text = token.string.strip()
-                if len(comment_text) > 72:
-                    message = (
-                        f"This comment at line {line_num} is {len(comment_text)} characters long. "
-                        "Way to kill the readability. 72 was too short for you?"
-                    )
-                else:
-                    message = (
-                        f"Extraneous comment at line {line_num}. "
-                        f"Real developers keep it all in their heads: {comment_text}"
-                    )
-                issues.append((line_num, message))
+    COMMENT = tokenize.COMMENT
+    tokens = tokenize.generate_tokens(io.StringIO(source_code).readline)
+    for token in tokens:
+        if token.type != COMMENT:
+            continue
+        line_num = token.start[0]
+        comment_text = token.string.strip()
+        if len(comment_text) > 72:
+            issues.append(
+                (line_num, MSG_COMMENT_TOO_LONG, (line_num, len(comment_text)))
+            )
+        else:
+            issues.append((line_num, MSG_COMMENT, (line_num, comment_text)))
 
     return issues
 
 
-def find_line_length_issues(file_path):
+def _scan_lines(lines):
     """
-    Checks each line:
-    - If it's a comment-only line (#...), limit is 72
-    - Otherwise, limit is 79
+    One pass over the source lines covering both line-based checks:
+    - Line length: comment-only lines (#...) are limited to 72, others to 79
+    - Imports: we complain if multiple modules are imported on the same line,
+      e.g. 'import sys, os' or 'from foo import bar, baz'.
+    'lines' are split on LF, CRLF and CR only, so they carry no line endings.
     """
     issues = []
-    if not os.path.exists(file_path):
-        return issues
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line_no, line in enumerate(f, start=1):
-            raw_line = line.rstrip('\n')
-            if not raw_line.strip():
-                continue
-            if raw_line.lstrip().startswith('#'):
-                if len(raw_line) > 72:
-                    msg = (
-                        f"Line {line_no} has {len(raw_line)} characters in a comment. "
-                        "72 is the limit, but apparently your brilliance needed more space?"
-                    )
-                    issues.append((line_no, msg))
-            else:
-                if len(raw_line) > 79:
-                    msg = (
-                        f"Line {line_no} has {len(raw_line)} characters. "
-                        "Trying to write the next War and Peace in one line?"
-                    )
-                    issues.append((line_no, msg))
+    append = issues.append
+    for line_no, line in enumerate(lines, start=1):
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+        length = len(line)
+        # Cheap first-character test before any method calls
+        first = stripped[0]
+
+        # Line length
+        if first == '#':
+            if length > 72:
+                append((line_no, MSG_COMMENT_LINE_TOO_LONG, (line_no, length)))
+            continue
+        if length > 79:
+            append((line_no, MSG_LINE_TOO_LONG, (line_no, length)))
+
+        # Imports
+        if first == 'i':
+            if stripped.startswith('import ') and stripped.find(',', 7) != -1:
+                append((line_no, MSG_MULTIPLE_IMPORTS, (line_no,)))
+        elif first == 'f':
+            if stripped.startswith('from '):
+                idx = stripped.find(' import ', 5)
+                if idx != -1 and stripped.find(',', idx + 8) != -1:
+                    append((line_no, MSG_MULTIPLE_FROM_IMPORTS, (line_no,)))
 
     return issues
 
 
-def find_import_issues(file_path):
+def _read_source(file_path):
     """
-    We complain if multiple modules are imported on the same line.
-    e.g. 'import sys, os' or 'from foo import bar, baz'.
+    Read and decode the file as UTF-8.
+    Large files are memory-mapped and decoded directly from the mapping,
+    which skips the intermediate bytes copy that f.read() would make.
     """
-    issues = []
-    if not os.path.exists(file_path):
-        return issues
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line_no, line in enumerate(f, start=1):
-            stripped = line.strip()
-            if stripped.startswith('import '):
-                after_import = stripped[len('import '):]
-                if ',' in after_import:
-                    msg = (
-                        f"Multiple imports on one line at {line_no}. "
-                        "You think we can read two modules in one breath?"
-                    )
-                    issues.append((line_no, msg))
-            elif stripped.startswith('from ') and ' import ' in stripped:
-                parts = stripped.split(' import ', maxsplit=1)
-                if len(parts) == 2:
-                    to_import = parts[1]
-                    if ',' in to_import:
-                        msg = (
-                            f"Multiple imports on one line at {line_no}. "
-                            "One import statement per line, please. Our tiny eyes can't parse multiple."
-                        )
-                        issues.append((line_no, msg))
-
-    return issues
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return f.read().decode('utf-8')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, 'utf-8')
 
 
-def run_snark_linter(file_path):
+def run_snark_linter(file_path, strict=False):
     """
-    Collect all comedic issues from the various checks.
+    Collect all comedic issues from the various checks, as
+    (line, message_id, args) tuples; see format_message.
     If there's a SyntaxError, produce one comedic complaint and skip everything else.
+    With strict=True, naming checks use the regexes instead of string methods.
+    The helper checks never touch the filesystem; they only see the source
+    read here.
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+    # Read the file once; every check below works on this in-memory copy.
+    # A missing file surfaces here as FileNotFoundError from open().
+    source_code = _read_source(file_path)
+    # Split on real line terminators only, like universal-newline reading;
+    # str.splitlines() would also break on form feeds, U+2028 and friends,
+    # shifting line numbers away from what compile() and tokenize report.
+    lines = source_code.replace('\r\n', '\n').replace('\r', '\n').split('\n')
 
     # Syntax parse check
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source_code = f.read()
-        tree = ast.parse(source_code, filename=file_path)
+        # Same as ast.parse (type comments stay off), minus the Python wrapper
+        tree = compile(
+            source_code, file_path, 'exec', ast.PyCF_ONLY_AST, dont_inherit=True
+        )
     except SyntaxError as e:
         line_number = e.lineno if e.lineno else 1
-        message = (
-            f"Wow, syntax error at line {line_number}. "
-            "Did you even try to run this code yourself? I can't parse this nonsense."
-        )
-        return [(line_number, message)]
+        return [(line_number, MSG_SYNTAX_ERROR, (line_number,))]
 
-    # AST-based checks
-    linter = SnarkLinter(file_path)
-    linter.visit(tree)
+    # AST-based checks; the walk order is not line order, so these need sorting
+    linter = SnarkLinter(file_path, strict=strict)
+    linter.analyze(tree)
     ast_issues = linter.issues
+    ast_issues.sort()
 
-    # Additional checks
-    comment_issues = find_comment_issues(file_path)
-    length_issues = find_line_length_issues(file_path)
-    import_issues = find_import_issues(file_path)
+    # Additional checks; both already come out in line order
+    comment_issues = find_comment_issues(source_code)
+    line_issues = _scan_lines(lines)
 
-    all_issues = ast_issues + comment_issues + length_issues + import_issues
-    all_issues.sort(key=lambda x: x[0])
-    return all_issues
+    return list(heapq.merge(ast_issues, comment_issues, line_issues))
+
+
+def collect_python_files(paths):
+    """
+    Expand the given paths into a list of Python files.
+    Files are kept as given; directories are searched recursively for
+    '*.py', skipping hidden directories such as .git or .venv.
+    """
+    file_paths = []
+    for path in paths:
+        if not os.path.isdir(path):
+            file_paths.append(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+            for name in sorted(files):
+                if name.endswith('.py'):
+                    file_paths.append(os.path.join(root, name))
+    return file_paths
+
+
+def _lint_file(file_path, strict):
+    """
+    Like run_snark_linter, but returns (issues, error) instead of raising,
+    so one missing or undecodable file doesn't sink the rest of a batch.
+    The error is passed back as a string so it pickles across processes.
+    """
+    try:
+        return run_snark_linter(file_path, strict=strict), None
+    except Exception as e:
+        return [], str(e)
+
+
+def lint_files(file_paths, strict=False, processes=None):
+    """
+    Lint several files, returning (file_path, issues, error) triples in
+    input order; 'error' is None unless that file could not be linted.
+    With processes > 1 the files are spread over a process pool; the checks
+    are CPU-bound Python code, so threads would just queue up on the GIL.
+    """
+    strict_flags = itertools.repeat(strict)
+    if processes and processes > 1 and len(file_paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            outcomes = list(pool.map(_lint_file, file_paths, strict_flags))
+    else:
+        outcomes = list(map(_lint_file, file_paths, strict_flags))
+    return [
+        (file_path, issues, error)
+        for file_path, (issues, error) in zip(file_paths, outcomes)
+    ]
+
+
+def iter_messages(issues, dedupe=False):
+    """
+    Yield (line, message) for each issue, formatting only as we go.
+    With dedupe=True, identical issues are reported once with an '(xN)'
+    suffix; they sit next to each other because issues come out sorted.
+    """
+    if not dedupe:
+        for line_num, message_id, message_args in issues:
+            yield line_num, format_message(message_id, message_args)
+        return
+
+    for (line_num, message_id, message_args), group in itertools.groupby(issues):
+        message = format_message(message_id, message_args)
+        count = sum(1 for _ in group)
+        if count > 1:
+            message = f"{message} (x{count})"
+        yield line_num, message
+
+
+def write_json_issues(results, stream, dedupe=False):
+    """
+    Stream the issues to 'stream' as a single JSON array, one object per line,
+    without building the whole document in memory first.
+    'results' is a list of (file_path, issues) pairs.
+    """
+    write = stream.write
+    dumps = json.dumps
+    wrote_any = False
+    write('[')
+    for file_path, issues in results:
+        for line_num, message in iter_messages(issues, dedupe):
+            write(',\n  ' if wrote_any else '\n  ')
+            write(dumps({
+                "file": file_path,
+                "line": line_num,
+                "message": message
+            }))
+            wrote_any = True
+    write('\n]\n' if wrote_any else ']\n')
 
 
 def main():
@@ -300,42 +515,62 @@ def main():
     Main entry point for the command line.
     If '--json' is specified, we output JSON.
     Otherwise, we do the usual text-based output.
+    Several files or directories may be given in one run, which saves the
+    interpreter startup per file; '--jobs N' lints them in parallel.
     """
     import argparse
     parser = argparse.ArgumentParser(description="A comedic Python linter.")
     parser.add_argument("--json", action="store_true", help="Output in JSON format")
-    parser.add_argument("filepath", nargs="?", help="Path to the Python file to lint")
+    parser.add_argument(
+        "--strict", action="store_true",
+        help="Use the reference regexes for class/function naming checks"
+    )
+    parser.add_argument(
+        "--dedupe", action="store_true",
+        help="Report identical issues on a line once, with a repeat count"
+    )
+    parser.add_argument(
+        "-j", "--jobs", "--processes", dest="processes", type=int, default=None,
+        metavar="N", help="Lint multiple files in parallel using N worker processes"
+    )
+    parser.add_argument(
+        "filepath", nargs="*",
+        help="Python file(s) to lint; directories are searched for *.py files"
+    )
     args = parser.parse_args()
 
     if not args.filepath:
-        print("Usage: python snark_linter.py [--json] path/to/your_file.py")
+        print(
+            "Usage: python snark_linter.py [--json] [--strict] [--dedupe] [--jobs N] "
+            "path/to/your_file.py_or_dir [...]"
+        )
         sys.exit(1)
 
-    file_path = args.filepath
     try:
-        issues = run_snark_linter(file_path)
-        if not issues:
-            if args.json:
-                print(json.dumps([]))
-            else:
-                print("No comedic issues found. Your code is evidently too normal.")
-        else:
-            if args.json:
-                # We’ll output a JSON array, each item containing line and message
-                output = []
-                for line_num, message in issues:
-                    output.append({
-                        "line": line_num,
-                        "message": message
-                    })
-                print(json.dumps(output, indent=2))
-            else:
-                # Plain-text output, as before
-                for line_num, message in issues:
-                    print(f"{file_path}:{line_num}: {message}")
-
+        file_paths = collect_python_files(args.filepath)
+        outcomes = lint_files(file_paths, strict=args.strict, processes=args.processes)
     except Exception as e:
-        print(f"Error analyzing file: {e}")
+        print(f"Error analyzing files: {e}")
+        sys.exit(1)
+
+    results = [(path, issues) for path, issues, error in outcomes if error is None]
+    errors = [(path, error) for path, _, error in outcomes if error is not None]
+
+    if args.json:
+        # We’ll output a JSON array, each item containing file, line and message
+        write_json_issues(results, sys.stdout, dedupe=args.dedupe)
+    elif not errors and not any(issues for _, issues in results):
+        print("No comedic issues found. Your code is evidently too normal.")
+    else:
+        # Plain-text output, as before
+        for file_path, issues in results:
+            for line_num, message in iter_messages(issues, args.dedupe):
+                print(f"{file_path}:{line_num}: {message}")
+
+    # Files we couldn't lint go to stderr so they never corrupt JSON output
+    for file_path, error in errors:
+        print(f"{file_path}: Error analyzing file: {error}", file=sys.stderr)
+    if errors:
         sys.exit(1)
 
 